@@ -47,6 +47,10 @@ class BaseFilter(BaseObject):
     """ Base Filter and Apply Logic """
 
     method = 'WherePasses'
+    # Order within a priority_group. Lower values are applied first.
+    priority = 1
+    # Filter can be expressed as a single ``ElementFilter``. See Collector.batch
+    batchable = True
 
     @classmethod
     def process_value(cls, value):
@@ -72,14 +76,16 @@ class BaseFilter(BaseObject):
         """
         method_name = cls.method
         method = getattr(collector, method_name)
+        return method(cls.get_filter(doc, value))
 
+    @classmethod
+    def get_filter(cls, doc, value):
+        """ Returns the processed input `value`, usually an ``ElementFilter`` """
         # FamilyInstanceFilter is the only Filter that  requires Doc
         if cls is not FilterClasses.FamilyInstanceFilter:
-            value = cls.process_value(value)
+            return cls.process_value(value)
         else:
-            value = cls.process_value(value, doc)
-
-        return method(value)
+            return cls.process_value(value, doc)
 
 
 class SuperQuickFilter(BaseFilter):
@@ -92,6 +98,22 @@ class QuickFilter(BaseFilter):
     priority_group = 1
 
 
+class ShortcutQuickFilter(QuickFilter):
+    """ Typical Quick. Uses a collector shortcut method when available """
+
+    # Collector shortcut methods by input value, ie.:
+    # {True: 'WhereElementIsElementType'}
+    # These skip building an ElementFilter for common values.
+    shortcuts = {}
+
+    @classmethod
+    def apply(cls, doc, collector, value):
+        shortcut_name = cls.shortcuts.get(value)
+        if shortcut_name:
+            return getattr(collector, shortcut_name)()
+        return super(ShortcutQuickFilter, cls).apply(doc, collector, value)
+
+
 class SlowFilter(BaseFilter):
     """ Typical Slow """
     priority_group = 2
@@ -172,10 +194,11 @@ class FilterClasses():
     def get_sorted(cls):
         """ Returns Defined Filter Classes sorted by priority """
         return sorted(FilterClasses.get_available_filters(),
-                      key=lambda f: f.priority_group)
+                      key=lambda f: (f.priority_group, f.priority))
 
     class ClassFilter(SuperQuickFilter):
         keyword = 'of_class'
+        priority = 0
 
         @classmethod
         def process_value(cls, class_reference):
@@ -190,8 +213,11 @@ class FilterClasses():
             category = to_category(category_reference)
             return DB.ElementCategoryFilter(category)
 
-    class IsTypeFilter(QuickFilter):
+    class IsTypeFilter(ShortcutQuickFilter):
         keyword = 'is_type'
+        priority = 0
+        shortcuts = {True: 'WhereElementIsElementType',
+                     False: 'WhereElementIsNotElementType'}
 
         @classmethod
         def process_value(cls, bool_value):
@@ -199,6 +225,8 @@ class FilterClasses():
 
     class IsNotTypeFilter(IsTypeFilter):
         keyword = 'is_not_type'
+        shortcuts = {True: 'WhereElementIsNotElementType',
+                     False: 'WhereElementIsElementType'}
 
         @classmethod
         def process_value(cls, bool_value):
@@ -224,8 +252,10 @@ class FilterClasses():
                 view_id = DB.ElementId.InvalidElementId
             return DB.ElementOwnerViewFilter(view_id, cls.reverse)
 
-    class ViewIndependentFilter(QuickFilter):
+    class ViewIndependentFilter(ShortcutQuickFilter):
         keyword = 'is_view_independent'
+        priority = 0
+        shortcuts = {True: 'WhereElementIsViewIndependent'}
 
         @classmethod
         def process_value(cls, bool_value):
@@ -292,6 +322,7 @@ class FilterClasses():
         >>> Collector(of_class='Wall', where=lambda x: 'Desk' in x.parameters['Length'] > 5.0)
         """
         keyword = 'where'
+        batchable = False
 
         @classmethod
         def apply(cls, doc, collector, func):
@@ -316,6 +347,7 @@ class FilterClasses():
 
     class InteresectFilter(LogicalFilter):
         keyword = 'and_collector'
+        batchable = False
 
         @classmethod
         def process_value(cls, collector):
@@ -337,6 +369,50 @@ class FilterClasses():
             return collector.UnionWith(new_collector)
 
 
+# Filter classes are fixed at import time. Resolve and sort them once
+# instead of scanning ``dir(FilterClasses)`` on every Collector call.
+_SORTED_FILTERS = tuple(FilterClasses.get_sorted())
+_VALID_FILTERS = frozenset(f.keyword for f in _SORTED_FILTERS)
+_BATCHABLE_FILTERS = frozenset(f.keyword for f in _SORTED_FILTERS
+                               if f.batchable)
+_QUICK_FILTERS = frozenset(f.keyword for f in _SORTED_FILTERS
+                           if f.priority_group <= QuickFilter.priority_group)
+
+# Query results cached by wrappers: {(doc, key): result}
+# Only used inside a Collector.cache_queries() context.
+_QUERY_CACHE = {}
+# Active Collector.cache_queries() contexts. Caching is off when empty.
+_QUERY_CACHE_CONTEXTS = []
+
+
+def _clear_query_cache(sender=None, event_args=None):
+    """ Clears _QUERY_CACHE. Also used as DocumentChanged handler """
+    _QUERY_CACHE.clear()
+
+
+class _QueryCacheContext(BaseObject):
+    """
+    Enables query caching while active. See :func:`Collector.cache_queries`
+    """
+
+    def __init__(self, doc):
+        self.app = doc.Application
+
+    def __enter__(self):
+        if not _QUERY_CACHE_CONTEXTS:
+            _clear_query_cache()
+        # Committed changes, including raw DB.Transactions, clear the cache
+        self.app.DocumentChanged += _clear_query_cache
+        _QUERY_CACHE_CONTEXTS.append(self)
+        return self
+
+    def __exit__(self, exception, exception_msg, tb):
+        self.app.DocumentChanged -= _clear_query_cache
+        _QUERY_CACHE_CONTEXTS.remove(self)
+        if not _QUERY_CACHE_CONTEXTS:
+            _clear_query_cache()
+
+
 class Collector(BaseObjectWrapper):
     """
     Revit FilteredElement Collector Wrapper
@@ -438,15 +514,18 @@ class Collector(BaseObjectWrapper):
 
         super(Collector, self).__init__(collector)
 
-        for key in filters.keys():
-            if key not in [f.keyword for f in FilterClasses.get_sorted()]:
-                raise RpwException('Filter not valid: {}'.format(key))
+        invalid_filters = set(filters) - _VALID_FILTERS
+        if invalid_filters:
+            invalid_names = ', '.join(sorted(invalid_filters))
+            raise RpwException('Filter not valid: {}'.format(invalid_names))
 
         self._collector = self._collect(collector_doc, collector, filters)
 
     def _collect(self, doc, collector, filters):
         """
-        Main Internal Recursive Collector Function.
+        Main Internal Collector Function.
+        Applies filters in priority order. Each filter returns a new
+        collector, which is fed to the next filter.
 
         Args:
             doc (`UI.UIDocument`): Document for the collector.
@@ -456,29 +535,30 @@ class Collector(BaseObjectWrapper):
         Returns:
             collector (`FilteredElementCollector`): FilteredElementCollector
         """
-        for filter_class in FilterClasses.get_sorted():
+        for filter_class in _SORTED_FILTERS:
             if filter_class.keyword not in filters:
                 continue
-            filter_value = filters.pop(filter_class.keyword)
-            logger.debug('Applying Filter: {}:{}'.format(filter_class, filter_value))
-            new_collector = filter_class.apply(doc, collector, filter_value)
-            return self._collect(doc, new_collector, filters)
+            filter_value = filters[filter_class.keyword]
+            # Value is not formatted: repr of a collector value counts its elements
+            logger.debug('Applying Filter: {}'.format(filter_class.keyword))
+            collector = filter_class.apply(doc, collector, filter_value)
         return collector
 
     def __iter__(self):
         """ Uses iterator to reduce unecessary memory usage """
         # TODO: Depracate or Make return Wrapped ?
-        for element in self._collector:
-            yield element
+        return iter(self._collector)
 
     def get_elements(self, wrapped=True):
         """
         Returns list with all elements instantiated using :any:`Element`
         """
+        # ToElements() fetches all elements in a single API call
+        elements = self._collector.ToElements()
         if wrapped:
-            return [Element(el) for el in self.__iter__()]
+            return [Element(el) for el in elements]
         else:
-            return [element for element in self.__iter__()]
+            return list(elements)
 
     @property
     def elements(self):
@@ -505,11 +585,10 @@ class Collector(BaseObjectWrapper):
         Returns:
             Element (`DB.Element`, `None`): First element or None
         """
-        try:
-            element = self[0]
-            return Element(element) if wrapped else element
-        except IndexError:
+        element = self._collector.FirstElement()
+        if element is None:
             return None
+        return Element(element) if wrapped else element
 
 
     # @property
@@ -521,7 +600,7 @@ class Collector(BaseObjectWrapper):
         """
         Returns list with all elements instantiated using :any:`Element`
         """
-        return [element_id for element_id in self._collector.ToElementIds()]
+        return list(self._collector.ToElementIds())
 
     @property
     def element_ids(self):
@@ -529,6 +608,151 @@ class Collector(BaseObjectWrapper):
                           'Collector.get_element_ids()')
         return self.get_element_ids()
 
+    @staticmethod
+    def batch(queries, doc=None, wrapped=True):
+        """
+        Runs several queries, sharing a single pass over the document
+        between queries that use slow filters.
+
+        >>> walls, rooms = Collector.batch([
+        ...     {'of_class': 'Wall', 'level': 'Level 1'},
+        ...     {'of_category': 'Rooms', 'parameter_filter': param_filter}])
+
+        The filters of those queries are combined into one
+        ``LogicalOrFilter`` collector. Each element collected is then routed
+        to every query whose filter it passes (``ElementFilter.PassesFilter``).
+        Routing evaluates each query's filter again, including its slow
+        filters, once per collected element.
+
+        Note:
+            These queries run as a regular :any:`Collector` instead:
+
+            * Queries with quick filters only. Revit already evaluates those
+              natively, so separate collectors are faster than routing.
+            * Queries with scope options (``doc``, ``view``, ``elements``,
+              ``element_ids``), or with ``where``, ``and_collector`` or
+              ``or_collector``, which cannot be combined.
+            * A single combinable query, as there is no pass to share.
+
+        Args:
+            queries (``[dict]``): List of Collector filters
+            doc (``DB.Document``, optional): Document [default: revit.doc]
+            wrapped (``bool``): Wraps elements using :any:`Element`
+
+        Returns:
+            ``[list]``: List of elements for each query, in the same order
+        """
+        doc = doc or revit.doc
+
+        def collect(filters):
+            # Query's own scope options, including doc, take precedence
+            collector = Collector(**dict({'doc': doc}, **filters))
+            return collector.get_elements(wrapped=wrapped)
+
+        results = [None] * len(queries)
+        query_filters = []  # [(query_index, ElementFilter)]
+        for index, filters in enumerate(queries):
+            if not _QUICK_FILTERS.issuperset(filters):
+                query_filter = Collector._get_batch_filter(doc, filters)
+                if query_filter is not None:
+                    query_filters.append((index, query_filter))
+                    continue
+            results[index] = collect(filters)
+
+        if len(query_filters) < 2:
+            for index, _ in query_filters:
+                results[index] = collect(queries[index])
+            return results
+
+        for index, _ in query_filters:
+            results[index] = []
+        element_filters = [f for _, f in query_filters]
+        combined_filter = DB.LogicalOrFilter(
+            List[DB.ElementFilter](element_filters))
+
+        collector = DB.FilteredElementCollector(doc).WherePasses(combined_filter)
+        for element in collector:
+            for index, query_filter in query_filters:
+                if query_filter.PassesFilter(element):
+                    results[index].append(Element(element) if wrapped
+                                          else element)
+        return results
+
+    @staticmethod
+    def _get_batch_filter(doc, filters):
+        """
+        Returns filters combined into a single ``ElementFilter``,
+        or ``None`` if they cannot be combined.
+        """
+        if not filters or not _BATCHABLE_FILTERS.issuperset(filters):
+            return None
+
+        element_filters = []
+        for filter_class in _SORTED_FILTERS:
+            if filter_class.keyword in filters:
+                filter_value = filters[filter_class.keyword]
+                element_filters.append(filter_class.get_filter(doc,
+                                                               filter_value))
+        if len(element_filters) == 1:
+            return element_filters[0]
+        return DB.LogicalAndFilter(List[DB.ElementFilter](element_filters))
+
+    @staticmethod
+    def cache_queries(doc=None):
+        """
+        Context in which wrapper queries are cached. Useful for read-heavy
+        scripts that repeat the same queries on an unchanged document.
+
+        >>> from rpw import db
+        >>> with db.Collector.cache_queries():
+        >>>     for wall_type in db.WallType.collect().get_elements():
+        >>>         walls = wall_type.get_instances()
+
+        Cached results are cleared when the context exits, when a document
+        change is committed (``DocumentChanged``), when a :any:`Transaction`
+        or :any:`TransactionGroup` starts or ends, and by rpw methods that
+        modify elements (ie. :func:`Wall.change_type`).
+        Other changes made inside an open transaction (ie. a Dynamo graph)
+        are not seen until then: call :func:`invalidate_cache` after them.
+
+        Args:
+            doc (``DB.Document``, optional): Document [default: revit.doc]
+        """
+        return _QueryCacheContext(doc or revit.doc)
+
+    @staticmethod
+    def cached(doc, key, func):
+        """
+        Returns cached result of ``func()`` for ``key`` on a document.
+        Used by wrappers to avoid repeating identical queries.
+        Outside of a :func:`cache_queries` context, ``func()`` always runs.
+
+        >>> Collector.cached(doc, 'wall_types',
+        ...                  lambda: WallType.collect().get_elements(wrapped=False))
+
+        Args:
+            doc (``DB.Document``): Document the query runs on
+            key (``hashable``): Query Key
+            func (``callable``): Function that runs the query
+
+        Returns:
+            Result of ``func()``
+        """
+        if not _QUERY_CACHE_CONTEXTS:
+            return func()
+
+        cache_key = (doc, key)
+        try:
+            return _QUERY_CACHE[cache_key]
+        except KeyError:
+            result = _QUERY_CACHE[cache_key] = func()
+            return result
+
+    @staticmethod
+    def invalidate_cache():
+        """ Clears query results stored by :func:`cached` """
+        _clear_query_cache()
+
     def __getitem__(self, index):
         # TODO: Depracate or Make return Wrapped ?
         for n, element in enumerate(self.__iter__()):
@@ -540,7 +764,11 @@ class Collector(BaseObjectWrapper):
 
     def __bool__(self):
         """ Evaluates to `True` if Collector.elements is not empty [] """
-        return bool(self.get_elements(wrapped=False))
+        # Stops at the first match instead of collecting all elements
+        first_id = self._collector.FirstElementId()
+        return first_id != DB.ElementId.InvalidElementId
+
+    __nonzero__ = __bool__  # Python 2
 
     def __len__(self):
         """ Returns length of collector.get_elements() """
@@ -618,45 +846,37 @@ class ParameterFilter(BaseObjectWrapper):
 
         """
         parameter_id = self.coerce_param_reference(parameter_reference)
-        reverse = conditions.get('reverse', False)
-        case_sensitive = conditions.get('case_sensitive', ParameterFilter.CASE_SENSITIVE)
-        precision = conditions.get('precision', ParameterFilter.FLOAT_PRECISION)
+        reverse = conditions.pop('reverse', False)
+        case_sensitive = conditions.pop('case_sensitive', ParameterFilter.CASE_SENSITIVE)
+        precision = conditions.pop('precision', ParameterFilter.FLOAT_PRECISION)
 
         for condition in conditions.keys():
             if condition not in ParameterFilter.RULES:
                 raise RpwException('Rule not valid: {}'.format(condition))
 
+        # Extra rule arguments by value type. Others only take the value
+        extra_args_by_type = {str: [case_sensitive], float: [precision]}
+
         rules = []
-        for condition_name, condition_value in conditions.iteritems():
+        for condition_name, condition_value in conditions.items():
 
-            # Returns on of the CreateRule factory method names above
-            rule_factory_name = ParameterFilter.RULES.get(condition_name)
-            filter_value_rule = getattr(DB.ParameterFilterRuleFactory,
-                                        rule_factory_name)
+            # Returns one of the CreateRule factory methods above
+            filter_value_rule = ParameterFilter._RULE_FACTORIES[condition_name]
 
             args = [condition_value]
-
-            if isinstance(condition_value, str):
-                args.append(case_sensitive)
-
-            if isinstance(condition_value, float):
-                args.append(precision)
+            args.extend(extra_args_by_type.get(type(condition_value), []))
 
             filter_rule = filter_value_rule(parameter_id, *args)
-            if 'not_' in condition_name:
+            if condition_name in ParameterFilter._INVERSE_RULES:
                 filter_rule = DB.FilterInverseRule(filter_rule)
 
-            logger.debug('ParamFilter Conditions: {}'.format(conditions))
-            logger.debug('Case sensitive: {}'.format(case_sensitive))
-            logger.debug('Reverse: {}'.format(reverse))
-            logger.debug('ARGS: {}'.format(args))
-            logger.debug(filter_rule)
-            logger.debug(str(dir(filter_rule)))
-
             rules.append(filter_rule)
         if not rules:
             raise RpwException('malformed filter rule: {}'.format(conditions))
 
+        logger.debug('ParamFilter Conditions: {} Case sensitive: {} '
+                     'Reverse: {}'.format(conditions, case_sensitive, reverse))
+
         _revit_object = DB.ElementParameterFilter(List[DB.FilterRule](rules),
                                                   reverse)
         super(ParameterFilter, self).__init__(_revit_object)
@@ -686,3 +906,12 @@ class ParameterFilter(BaseObjectWrapper):
 
     def __repr__(self):
         return super(ParameterFilter, self).__repr__(data=self.conditions)
+
+
+# Resolve Rule factory methods once instead of on every condition
+ParameterFilter._RULE_FACTORIES = dict(
+    (condition_name, getattr(DB.ParameterFilterRuleFactory, factory_name))
+    for condition_name, factory_name in ParameterFilter.RULES.items())
+ParameterFilter._INVERSE_RULES = frozenset(
+    condition_name for condition_name in ParameterFilter.RULES
+    if condition_name.startswith('not_'))
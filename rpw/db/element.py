@@ -15,6 +15,9 @@ from rpw.utils.mixins import CategoryMixin
 from rpw.db.builtins import BicEnum, BipEnum
 from rpw.utils.coerce import to_element_ids
 
+# Wrapper class resolved for each Revit class: {(cls, type(element)): class}
+_WRAPPER_CLASS_CACHE = {}
+
 
 class Element(BaseObjectWrapper, CategoryMixin):
     """
@@ -66,10 +69,9 @@ class Element(BaseObjectWrapper, CategoryMixin):
         Factory Constructor will chose the best Class for the Element.
         This function iterates through all classes in the rpw.db module,
         and will find one that wraps the corresponding class. If and exact
-        match is not found :any:`Element` is used
+        match is not found :any:`Element` is used.
+        The class found is cached, so discovery only runs once per type.
         """
-        defined_wrapper_classes = rpw.db.__all__
-
         _revit_object_class = cls._revit_object_class
 
         if element is None:
@@ -88,23 +90,25 @@ class Element(BaseObjectWrapper, CategoryMixin):
         if not isinstance(element, _revit_object_class):
             raise RpwTypeError(_revit_object_class, element.__class__)
 
+        element_class = type(element)
+
         # If explicit constructor was called, use that and skip discovery
-        if type(element) is _revit_object_class:
+        if element_class is _revit_object_class:
             return super(Element, cls).__new__(cls, element, **kwargs)
 
-        for wrapper_class in defined_wrapper_classes:
-            class_name = wrapper_class.__name__
-            if type(element) is getattr(wrapper_class, '_revit_object_class', None):
-                # Found Mathing Class, Use Wrapper
-                # print('Found Mathing Class, Use Wrapper: {}'.format(class_name))
-                return super(Element, cls).__new__(wrapper_class, element, **kwargs)
-        else:
+        wrapper_class = _WRAPPER_CLASS_CACHE.get((cls, element_class))
+        if wrapper_class is None:
             # Could Not find a Matching Class, Use Element if related
-            return super(Element, cls).__new__(cls, element, **kwargs)
+            wrapper_class = cls
+            for defined_wrapper_class in rpw.db.__all__:
+                if element_class is getattr(defined_wrapper_class,
+                                            '_revit_object_class', None):
+                    # Found Mathing Class, Use Wrapper
+                    wrapper_class = defined_wrapper_class
+                    break
+            _WRAPPER_CLASS_CACHE[(cls, element_class)] = wrapper_class
 
-        # No early return. Should not reach this point
-        element_class_name = element.__class__.__name__
-        raise RpwException('Factory does not support type: {}'.format(element_class_name))
+        return super(Element, cls).__new__(wrapper_class, element, **kwargs)
 
     def __init__(self, element, doc=None):
         """
@@ -160,6 +164,7 @@ class Element(BaseObjectWrapper, CategoryMixin):
     @name.setter
     def name(self, value):
         """ Name Property Setter """
+        rpw.db.Collector.invalidate_cache()
         return DB.Element.Name.__set__(self.unwrap(), value)
 
     @classmethod
@@ -258,6 +263,7 @@ class Element(BaseObjectWrapper, CategoryMixin):
     def delete(self):
         """ Deletes Element from Model """
         self.doc.Delete(self._revit_object.Id)
+        rpw.db.Collector.invalidate_cache()
 
     def __repr__(self, data=None):
         if data is None:
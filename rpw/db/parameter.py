@@ -7,6 +7,7 @@ Parameter Wrapper
 5.0
 
 """  #
+import rpw
 from rpw import revit, DB
 from rpw.db.builtins import BipEnum
 from rpw.base import BaseObjectWrapper
@@ -279,6 +280,7 @@ class Parameter(BaseObjectWrapper):
                 raise RpwWrongStorageType(self.type, value)
 
         param = self._revit_object.Set(value)
+        rpw.db.Collector.invalidate_cache()
         return param
 
     @property
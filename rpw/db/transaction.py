@@ -1,4 +1,5 @@
 import traceback
+import rpw
 from rpw import revit, DB
 from rpw.base import BaseObjectWrapper
 from rpw.exceptions import RpwException
@@ -34,10 +35,12 @@ class Transaction(BaseObjectWrapper):
         self.transaction = self._revit_object
 
     def __enter__(self):
+        rpw.db.Collector.invalidate_cache()
         self.transaction.Start()
         return self
 
     def __exit__(self, exception, exception_msg, tb):
+        rpw.db.Collector.invalidate_cache()
         if exception:
             self.transaction.RollBack()
             logger.error('Error in Transaction Context: has rolled back.')
@@ -117,10 +120,12 @@ class TransactionGroup(BaseObjectWrapper):
         self.assimilate = assimilate
 
     def __enter__(self):
+        rpw.db.Collector.invalidate_cache()
         self.transaction_group.Start()
         return self.transaction_group
 
     def __exit__(self, exception, exception_msg, tb):
+        rpw.db.Collector.invalidate_cache()
         if exception:
             self.transaction_group.RollBack()
             logger.error('Error in TransactionGroup Context: has rolled back.')
@@ -14,6 +14,11 @@ from rpw.db.builtins import BipEnum
 from rpw.exceptions import RpwTypeError, RpwCoerceError
 from rpw.utils.mixins import ByNameCollectMixin
 
+# ParameterFilters matching walls by type name: {name: ParameterFilter}
+_TYPE_NAME_FILTERS = {}
+# DB.WallKind members. Resolved on first use by WallCategory.get_families()
+_WALL_KINDS = []
+
 
 class Wall(FamilyInstance):
     """
@@ -35,6 +40,7 @@ class Wall(FamilyInstance):
         wall_type = WallType.by_name_or_element_ref(wall_type_reference)
         wall_type_id = to_element_id(wall_type)
         self._revit_object.ChangeTypeId(wall_type_id)
+        rpw.db.Collector.invalidate_cache()
 
     def get_symbol(self, wrapped=True):
         """ Get Wall Type Alias """
@@ -116,10 +122,26 @@ class WallType(FamilySymbol, ByNameCollectMixin):
 
     def get_instances(self, wrapped=True):
         """ Returns all Instances of this Wall Types """
-        bip = BipEnum.get_id('SYMBOL_NAME_PARAM')
-        param_filter = rpw.db.ParameterFilter(bip, equals=self.name)
-        return rpw.db.Collector(parameter_filter=param_filter,
-                                **Wall._collector_params).wrapped_elements
+        def collect_instances():
+            param_filter = WallType._get_name_filter(self.name)
+            collector = rpw.db.Collector(doc=self.doc,
+                                         parameter_filter=param_filter,
+                                         **Wall._collector_params)
+            return collector.get_elements(wrapped=False)
+
+        key = ('wall_type_instances', self._revit_object.Id.IntegerValue)
+        walls = rpw.db.Collector.cached(self.doc, key, collect_instances)
+        return [Wall(wall) for wall in walls] if wrapped else list(walls)
+
+    @staticmethod
+    def _get_name_filter(name):
+        """ Returns ParameterFilter for walls of type ``name``. Cached """
+        param_filter = _TYPE_NAME_FILTERS.get(name)
+        if param_filter is None:
+            bip = BipEnum.get_id('SYMBOL_NAME_PARAM')
+            param_filter = rpw.db.ParameterFilter(bip, equals=name)
+            _TYPE_NAME_FILTERS[name] = param_filter
+        return param_filter
 
     @property
     def instances(self):
@@ -180,10 +202,20 @@ class WallKind(BaseObjectWrapper):
 
     def get_wall_types(self, wrapped=True):
         """ Get Wall Types Alias """
-        type_collector = rpw.db.WallType.collect()
-        wall_types = type_collector.get_elements(wrapped=wrapped)
-        return [wall_type for wall_type in wall_types
-                if wall_type.Kind == self._revit_object]
+        kind = self._revit_object
+
+        def collect_wall_types():
+            # WallKind is not stored in a parameter, so filter the unwrapped
+            # types and only wrap the matches.
+            type_collector = rpw.db.WallType.collect()
+            return [wall_type for wall_type in type_collector
+                    if wall_type.Kind == kind]
+
+        wall_types = rpw.db.Collector.cached(revit.doc, ('wall_types', kind),
+                                             collect_wall_types)
+        if wrapped:
+            return [WallType(wall_type) for wall_type in wall_types]
+        return list(wall_types)
 
     @property
     def wall_types(self):
@@ -192,9 +224,13 @@ class WallKind(BaseObjectWrapper):
 
     def get_instances(self, wrapped=True):
         """ Returns all Wall instances of this given Wall Kind"""
-        instances = []
-        for wall_type in self.get_wall_types(wrapped=True):
-            instances.extend(wall_type.get_instances(wrapped=wrapped))
+        wall_type_ids = set(wall_type.Id.IntegerValue for wall_type
+                            in self.get_wall_types(wrapped=False))
+        walls = rpw.db.Wall.collect()
+        instances = [wall for wall in walls
+                     if wall.GetTypeId().IntegerValue in wall_type_ids]
+        if wrapped:
+            return [Wall(wall) for wall in instances]
         return instances
 
     @property
@@ -227,13 +263,14 @@ class WallCategory(Category):
 
     def get_families(self, wrapped=True):
         """ Returns ``DB.WallKind`` elements in the category """
-        wall_kinds = []
-        for member in dir(DB.WallKind):
-            if type(getattr(DB.WallKind, member)) is DB.WallKind:
+        if not _WALL_KINDS:
+            for member in dir(DB.WallKind):
                 wall_kind = getattr(DB.WallKind, member)
-                wall_kind = WallKind(wall_kind) if wrapped else wall_kind
-                wall_kinds.append(wall_kind)
-        return wall_kinds
+                if type(wall_kind) is DB.WallKind:
+                    _WALL_KINDS.append(wall_kind)
+        if wrapped:
+            return [WallKind(wall_kind) for wall_kind in _WALL_KINDS]
+        return list(_WALL_KINDS)
 
     @property
     def families(self):
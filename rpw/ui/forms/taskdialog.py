@@ -137,7 +137,8 @@ class TaskDialog(BaseObjectWrapper):
             self.dialog.CommonButtons = common_buttons
 
         # Set Default Button
-        self.dialog.DefaultButton = UI.TaskDialogResult.None
+        # 'None' is a keyword in Python 3
+        self.dialog.DefaultButton = getattr(UI.TaskDialogResult, 'None')
 
         # Validate Commands
         commands = commands or []
@@ -10,6 +10,11 @@ from rpw.db.builtins import BicEnum
 from rpw.utils.dotnet import List
 from rpw.exceptions import RpwTypeError
 
+# Class and Category names resolve to the same objects for the whole session.
+# Cache them to avoid repeated reflection and fuzzy matching.
+_CLASS_CACHE = {}
+_CATEGORY_CACHE = {}
+
 
 def to_element_id(element_reference):
     """
@@ -118,7 +123,11 @@ def to_class(class_reference):
         [``type``]: Class
     """
     if isinstance(class_reference, str):
-        return getattr(DB, class_reference)
+        class_ = _CLASS_CACHE.get(class_reference)
+        if class_ is None:
+            class_ = getattr(DB, class_reference)
+            _CLASS_CACHE[class_reference] = class_
+        return class_
     if isinstance(class_reference, type):
         return class_reference
     raise RpwTypeError('Class Type, Class Type Name', type(class_reference))
@@ -145,10 +154,14 @@ def to_category(category_reference, fuzzy=True):
     if isinstance(category_reference, DB.BuiltInCategory):
         return category_reference
     if isinstance(category_reference, str):
-        if fuzzy:
-            return BicEnum.fuzzy_get(category_reference)
-        else:
-            return BicEnum.get(category_reference)
+        category = _CATEGORY_CACHE.get((category_reference, fuzzy))
+        if category is None:
+            if fuzzy:
+                category = BicEnum.fuzzy_get(category_reference)
+            else:
+                category = BicEnum.get(category_reference)
+            _CATEGORY_CACHE[(category_reference, fuzzy)] = category
+        return category
     if isinstance(category_reference, DB.ElementId):
         return BicEnum.from_category_id(category_reference)
     raise RpwTypeError('Category Type, Category Type Name',
@@ -113,6 +113,11 @@ class CollectorTests(unittest.TestCase):
         x = self.collector_helper({'of_class': DB.View})
         assert isinstance(x.get_first(wrapped=False), DB.View)
 
+    def test_collector_first_empty(self):
+        view_hidden = doc.GetElement(DB.ElementId(12531))
+        x = self.collector_helper({'of_class': DB.Wall, 'view': view_hidden})
+        self.assertIsNone(x.get_first())
+
     def test_collector_caster(self):
         x = self.collector_helper({'of_class': DB.Wall}).elements[0]
         assert isinstance(x, DB.Wall)
@@ -192,6 +197,71 @@ class CollectorTests(unittest.TestCase):
         second_symbol = rpw.db.Collector(of_class='Wall', symbol=desk_types[1]).elements
         self.assertEqual(len(second_symbol), 0)
 
+    def test_collector_invalid_filter(self):
+        with self.assertRaises(rpw.exceptions.RpwException):
+            rpw.db.Collector(of_class='Wall', of_kind='Basic')
+
+    def test_collector_filter_order(self):
+        sorted_filters = rpw.db.collector.FilterClasses.get_sorted()
+        keywords = [f.keyword for f in sorted_filters]
+        self.assertEqual(keywords[:2], ['of_class', 'of_category'])
+        self.assertLess(keywords.index('is_not_type'), keywords.index('family'))
+        self.assertLess(keywords.index('exclude'), keywords.index('level'))
+        self.assertEqual(keywords[-1:], ['or_collector'])
+
+    def assert_batch_matches(self, queries):
+        results = rpw.db.Collector.batch(queries, wrapped=False)
+        self.assertEqual(len(results), len(queries))
+        for query, elements in zip(queries, results):
+            collector = rpw.db.Collector(**query)
+            self.assertEqual(len(collector), len(elements))
+            self.assertEqual(set(e.Id.IntegerValue for e in collector),
+                             set(e.Id.IntegerValue for e in elements))
+
+    def test_collector_batch(self):
+        level_filter = rpw.db.ParameterFilter('DATUM_TEXT', ends='1')
+        height_filter = rpw.db.ParameterFilter('WALL_USER_HEIGHT_PARAM', greater=1.0)
+        self.assert_batch_matches([
+            {'of_class': 'Wall', 'is_not_type': True},
+            {'of_category': 'OST_Levels', 'parameter_filter': level_filter},
+            {'of_class': 'Wall', 'parameter_filter': height_filter},
+            {'of_class': 'View', 'where': lambda x: x.IsTemplate}])
+
+    def test_collector_batch_scope(self):
+        height_filter = rpw.db.ParameterFilter('WALL_USER_HEIGHT_PARAM', greater=1.0)
+        self.assert_batch_matches([
+            {'of_class': 'Wall', 'doc': doc},
+            {'of_class': 'Wall', 'view': uidoc.ActiveView,
+             'parameter_filter': height_filter}])
+
+    def test_collector_cached(self):
+        calls = []
+        def query():
+            calls.append(1)
+            return rpw.db.Collector(of_class='View').get_elements(wrapped=False)
+        with rpw.db.Collector.cache_queries():
+            rv = rpw.db.Collector.cached(doc, 'test_views', query)
+            rv2 = rpw.db.Collector.cached(doc, 'test_views', query)
+            self.assertIs(rv, rv2)
+            self.assertEqual(len(calls), 1)
+            rpw.db.Collector.invalidate_cache()
+            rpw.db.Collector.cached(doc, 'test_views', query)
+            self.assertEqual(len(calls), 2)
+            with rpw.db.Transaction('Cache Test'):
+                pass
+            rpw.db.Collector.cached(doc, 'test_views', query)
+            self.assertEqual(len(calls), 3)
+        self.assertEqual(rpw.db.collector._QUERY_CACHE, {})
+
+    def test_collector_cached_disabled(self):
+        calls = []
+        def query():
+            calls.append(1)
+            return []
+        rpw.db.Collector.cached(doc, 'test_views', query)
+        rpw.db.Collector.cached(doc, 'test_views', query)
+        self.assertEqual(len(calls), 2)
+
 ##############################
 # Built in Element Collector #
 ##############################
@@ -275,6 +345,11 @@ class ParameterFilterTests(unittest.TestCase):
         col = rpw.db.Collector(of_class="Wall", parameter_filter=parameter_filter)
         self.assertEqual(len(col), 0)
 
+    def test_param_filter_float_equal_reverse(self):
+        parameter_filter = rpw.db.ParameterFilter(self.param_id_height, equals=12.0, reverse=True)
+        col = rpw.db.Collector(of_class="Wall", parameter_filter=parameter_filter)
+        self.assertEqual(len(col), 0)
+
     def test_param_filter_float_greater(self):
         parameter_filter = rpw.db.ParameterFilter(self.param_id_height, greater=10.0)
         col = rpw.db.Collector(of_class="Wall", parameter_filter=parameter_filter)
@@ -327,6 +327,15 @@ class WallTests(unittest.TestCase):
             wall.change_type('Wall 2')
         self.assertEqual(wall.wall_type.name, 'Wall 2')
 
+    def test_wall_change_type_cached(self):
+        wall = self.wall
+        wall_type = wall.get_wall_type()
+        with rpw.db.Collector.cache_queries():
+            self.assertEqual(len(wall_type.get_instances()), 1)
+            with rpw.db.Transaction():
+                wall.change_type('Wall 2')
+                self.assertEqual(len(wall_type.get_instances()), 0)
+
     def test_wall_change_type(self):
         wall = self.wall
         wall_type = rpw.db.Collector(of_class='WallType', where=lambda w: w.name == 'Wall 2').get_first(wrapped=False)
@@ -112,6 +112,20 @@ class CoerceTests(unittest.TestCase):
         self.assertIs(rpw.utils.coerce.to_category('stackedwalls'), DB.BuiltInCategory.OST_StackedWalls)
         self.assertIs(rpw.utils.coerce.to_category('stacked walls'), DB.BuiltInCategory.OST_StackedWalls)
 
+    def test_to_category_cached(self):
+        category_cache = rpw.utils.coerce._CATEGORY_CACHE
+        category_cache.pop(('Walls', True), None)
+        self.assertNotIn(('Walls', True), category_cache)
+        self.assertIs(rpw.utils.coerce.to_category('Walls'), DB.BuiltInCategory.OST_Walls)
+        self.assertIn(('Walls', True), category_cache)
+        self.assertIs(category_cache[('Walls', True)], DB.BuiltInCategory.OST_Walls)
+
+    def test_to_category_cached_failed(self):
+        category_cache = rpw.utils.coerce._CATEGORY_CACHE
+        with self.assertRaises(rpw.exceptions.RpwCoerceError):
+            rpw.utils.coerce.to_category('Walls', fuzzy=False)
+        self.assertNotIn(('Walls', False), category_cache)
+
     def test_to_iterable(self):
         self.assertTrue([w for w in rpw.utils.coerce.to_iterable(self.wall)])
 